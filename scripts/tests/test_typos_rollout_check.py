@@ -7,16 +7,13 @@ import types
 
 import pytest
 
-SCRIPTS = Path(__file__).resolve().parents[1]
 PROHIBITED = "hand" + "-written"
 TITLE_PROHIBITED = "Hand" + "-written"
 
 
-@pytest.fixture
-def checker(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
-    """Import the standalone phrase checker from the scripts directory."""
-    monkeypatch.syspath_prepend(str(SCRIPTS))
-    importlib.invalidate_caches()
+@pytest.fixture(scope="session")
+def checker() -> types.ModuleType:
+    """Import the standalone phrase checker once per test session."""
     return importlib.import_module("typos_rollout_check")
 
 